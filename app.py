@@ -1,17 +1,16 @@
 import streamlit as st
-import requests
 from datetime import datetime
-from itertools import permutations
 import logging
-from typing import List, Dict, Optional
+from collections import defaultdict
+from typing import Iterator, List, Dict, Optional, Set, Tuple
 import re
 
 from config import Config
 from utils import (
-    parse_article, parse_mixtral_response, validate_date,
+    parse_article, parse_mixtral_response, parse_date, validate_date,
     format_search_results, create_custom_css
 )
-from github_utils import get_github_file_contents, get_repo_stats
+from github_utils import get_github_file_contents, get_repo_stats, get_http_session
 from translate_utils import (
     translate_text, detect_language, highlight_matching_text,
     get_color_legend
@@ -24,6 +23,33 @@ logger = logging.getLogger(__name__)
 # Initialize Hugging Face API settings
 headers = {"Authorization": f"Bearer {st.secrets['HUGGINGFACE_API_KEY']}"}
 
+# Word characters plus the Gujarati block, so vowel signs stay inside their word
+_TOKEN_RE = re.compile(r"[\w\u0a80-\u0aff]+")
+
+_DATE_HEADER = "Date:"
+# Characters after the header searched for the date, allowing for leading whitespace
+_DATE_VALUE_WINDOW = 25
+
+_QUICK_DATE_RE = re.compile(r"\b([0-9]{2}-[0-9]{2}-[0-9]{4})\b")
+
+# Filler words dropped from queries before they are used as tags
+_STOPWORDS = frozenset({
+    'a', 'an', 'the', 'in', 'at', 'on', 'of', 'for', 'and', 'or', 'to', 'from',
+    'about', 'with', 'by', 'into', 'over', 'any', 'some', 'all', 'this', 'that', 'these', 'those',
+    'news', 'latest', 'articles', 'article', 'show', 'me', 'find', 'tell', 'give', 'get', 'search',
+    'what', 'which', 'who', 'whom', 'whose', 'when', 'where', 'why', 'how',
+    'is', 'are', 'was', 'were', 'be', 'been', 'being', 'am',
+    'do', 'does', 'did', 'doing', 'has', 'have', 'had', 'having',
+    'can', 'could', 'will', 'would', 'shall', 'should', 'may', 'might', 'must',
+    'i', 'you', 'he', 'she', 'it', 'we', 'they', 'my', 'our', 'your', 'their', 'its', 'there', 'happened'
+})
+
+# Relative date phrases only the model can turn into a DD-MM-YYYY date
+_DATE_HINT_WORDS = frozenset({
+    'today', 'yesterday', 'tomorrow', 'last', 'past', 'recent', 'recently',
+    'week', 'weeks', 'month', 'months', 'year', 'years', 'since', 'after', 'before', 'ago'
+})
+
 @st.cache_data(ttl=Config.CACHE_TTL)
 def query_mixtral(prompt: str) -> Optional[str]:
     """Query the Mixtral model through Hugging Face API"""
@@ -34,7 +60,7 @@ def query_mixtral(prompt: str) -> Optional[str]:
         }
 
         logger.info(f"Querying Mixtral with prompt: {prompt[:100]}...")
-        response = requests.post(Config.API_URL, headers=headers, json=payload)
+        response = get_http_session().post(Config.API_URL, headers=headers, json=payload)
         response.raise_for_status()
         return response.json()[0]["generated_text"]
     except Exception as e:
@@ -42,6 +68,34 @@ def query_mixtral(prompt: str) -> Optional[str]:
         st.error(f"Error querying Mixtral: {str(e)}")
         return None
 
+def extract_query_terms(query: str) -> Optional[Tuple[List[str], Optional[str]]]:
+    """Extract tags and date from a simple keyword query, or None if the model is needed"""
+    date = None
+    date_match = _QUICK_DATE_RE.search(query)
+    if date_match:
+        if not validate_date(date_match.group(1)):
+            return None
+        date = date_match.group(1)
+        query = query[:date_match.start()] + " " + query[date_match.end():]
+
+    words = _TOKEN_RE.findall(query.lower())
+    if len(words) > Config.QUICK_QUERY_MAX_WORDS or _DATE_HINT_WORDS.intersection(words):
+        return None
+
+    # Numbers such as a bare year are date hints for the model, not substring tags
+    if any(char.isdigit() for word in words for char in word):
+        return None
+
+    # Short leftovers would match inside unrelated words
+    tags = [
+        word for word in words
+        if word not in _STOPWORDS and len(word) >= Config.QUICK_QUERY_MIN_TAG_LENGTH
+    ]
+    if len(tags) < 2:
+        return None
+
+    return tags, date
+
 def translate_query_and_extract(query: str, source_lang: str) -> tuple[List[str], Optional[str]]:
     """Translate query if needed and extract tags and date"""
     if source_lang == 'gu':
@@ -49,6 +103,11 @@ def translate_query_and_extract(query: str, source_lang: str) -> tuple[List[str]
     else:
         query_en = query
 
+    # Short keyword queries are answered locally without a model round-trip
+    quick_result = extract_query_terms(query_en)
+    if quick_result is not None:
+        return quick_result
+
     prompt = f"""Given the following news search query, extract relevant search tags and date information.
     Query: "{query_en}"
 
@@ -62,44 +121,107 @@ def translate_query_and_extract(query: str, source_lang: str) -> tuple[List[str]
         return parse_mixtral_response(response)
     return [], None
 
-def search_articles(tags: List[str], date: Optional[str] = None) -> List[Dict]:
-    """Search for articles based on tags and date"""
-    results = []
-    files = get_github_file_contents()
-
-    for file in files:
+def parse_article_date(content: str) -> Optional[datetime]:
+    """Extract the publication date of an article, or None if it has no valid date"""
+    # Each "Date:" header is located with a plain find instead of a regex scan; a malformed
+    # header falls through to the next one
+    date_start = content.find(_DATE_HEADER)
+    while date_start != -1:
+        value_start = date_start + len(_DATE_HEADER)
+        candidate = content[value_start:value_start + _DATE_VALUE_WINDOW].lstrip()[:len("DD-MM-YYYY")]
+        article_date = parse_date(candidate)
+        if article_date is not None:
+            return article_date
+        date_start = content.find(_DATE_HEADER, value_start)
+
+    return None
+
+# Shared read-only across sessions; cache_data would unpickle the whole index on every query
+@st.cache_resource(ttl=Config.CACHE_TTL)
+def build_index() -> Tuple[Dict[str, Set[int]], List[Dict], List[str], str]:
+    """Build an inverted index from token to article positions over the news corpus"""
+    index = defaultdict(set)
+    articles = []
+    documents = []
+
+    for file in get_github_file_contents():
         try:
             content = file['content']
+            content_lower = content.lower()
+            article_id = len(articles)
+
+            article = parse_article(content)
+            article['_dt'] = parse_article_date(content)
+            article['_title_lang'] = detect_language(article['title'])
+            article['_lang'] = detect_language(article['content'])
 
-            # Create all possible combinations of tags
-            all_combinations = []
-            for r in range(1, len(tags) + 1):
-                all_combinations.extend(permutations(tags, r))
-
-            # Check if any combination of tags is present
-            found = False
-            for combo in all_combinations:
-                if all(tag.lower() in content.lower() for tag in combo):
-                    found = True
-                    break
-
-            if found:
-                article_date_match = re.search(r"Date:\s*(\d{2}-\d{2}-\d{4})", content)
-                if article_date_match:
-                    article_date = datetime.strptime(article_date_match.group(1), "%d-%m-%Y")
-
-                    if date and validate_date(date):
-                        query_date = datetime.strptime(date, "%d-%m-%Y")
-                        if article_date >= query_date:
-                            results.append(parse_article(content))
-                    else:
-                        results.append(parse_article(content))
+            articles.append(article)
+            documents.append(content_lower)
+            for token in set(_TOKEN_RE.findall(content_lower)):
+                index[token].add(article_id)
 
         except Exception as e:
-            logger.error(f"Error processing file {file['name']}: {str(e)}")
+            logger.error(f"Error indexing file {file['name']}: {str(e)}")
             continue
 
-    return results
+    # Newline-terminated vocabulary, so one C-level find() scans every token at once
+    vocabulary = "".join(f"{token}\n" for token in index)
+
+    return dict(index), articles, documents, vocabulary
+
+def tokens_containing(word: str, vocabulary: str) -> Set[str]:
+    """Return every indexed token that contains the word"""
+    tokens = set()
+    start = vocabulary.find(word)
+
+    while start != -1:
+        token_start = vocabulary.rfind("\n", 0, start) + 1
+        token_end = vocabulary.find("\n", start)
+        tokens.add(vocabulary[token_start:token_end])
+        start = vocabulary.find(word, token_end)
+
+    return tokens
+
+def match_tag(tag: str, index: Dict[str, Set[int]], documents: List[str], vocabulary: str) -> Set[int]:
+    """Return the positions of articles whose content contains the tag"""
+    tag_lower = tag.lower()
+    words = _TOKEN_RE.findall(tag_lower)
+    if not words:
+        return set()
+
+    # A word can only occur inside a single token, so scanning the vocabulary
+    # keeps the substring semantics of a full-text scan
+    matches = None
+    for word in words:
+        postings = set()
+        for token in tokens_containing(word, vocabulary):
+            postings |= index[token]
+        matches = postings if matches is None else matches & postings
+
+    # Tags spanning several words or punctuation are verified against the text
+    if tag_lower != words[0]:
+        matches = {article_id for article_id in matches if tag_lower in documents[article_id]}
+
+    return matches
+
+def search_articles(tags: List[str], date: Optional[str] = None) -> Iterator[Dict]:
+    """Search for articles based on tags and date, yielding matches in corpus order"""
+    index, articles, documents, vocabulary = build_index()
+
+    # An article matches if any of the tags is present
+    matching = set().union(*(match_tag(tag, index, documents, vocabulary) for tag in tags))
+
+    query_date = parse_date(date) if date else None
+
+    for article_id in sorted(matching):
+        article = articles[article_id]
+
+        # Articles without a parseable date are never returned
+        if article['_dt'] is None:
+            continue
+        if query_date is None or article['_dt'] >= query_date:
+            # Copy so callers never mutate the shared index
+            yield article.copy()
 
 def initialize_session_state():
     """Initialize session state variables"""
@@ -173,19 +295,17 @@ def main():
                 # Show color legend for search terms
                 st.markdown(get_color_legend(tags), unsafe_allow_html=True)
 
-                # Search and format results
+                # Search and format results lazily so each one renders as soon as it is ready
                 results = search_articles(tags, date)
                 formatted_results = format_search_results(results, tags, output_lang_code)
 
-                # Display results count
-                results_count = len(formatted_results)
-                results_text = f"Found {results_count} articles"
-                if output_lang_code == 'gu':
-                    results_text = translate_text(results_text, 'en', 'gu')
-                st.markdown(f"### {results_text}")
+                # Reserve the spot above the results for the count, filled in once they are all shown
+                results_count_placeholder = st.empty()
+                results_count = 0
 
                 # Display results
                 for idx, result in enumerate(formatted_results):
+                    results_count += 1
                     with st.expander(f"{result['title']} ({result['date']})"):
                         st.markdown(f"[Read original article]({result['link']})")
                         st.markdown("---")
@@ -209,5 +329,11 @@ def main():
                                     tags
                                 ), unsafe_allow_html=True)
 
+                # Display results count
+                results_text = f"Found {results_count} articles"
+                if output_lang_code == 'gu':
+                    results_text = translate_text(results_text, 'en', 'gu')
+                results_count_placeholder.markdown(f"### {results_text}")
+
 if __name__ == "__main__":
     main()
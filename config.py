@@ -12,13 +12,19 @@ class Config:
     GITHUB_REPO_OWNER = "sleeky-glitch"
     GITHUB_REPO_NAME = "Gujratinewsbotprod"
     GITHUB_BRANCH = "main"
+    MAX_FETCH_WORKERS = 32
 
     # File Pattern
-    NEWS_FILE_PATTERN = "dd_news_"
+    NEWS_FILE_PATTERN = "dd_news_page_*.txt"
 
     # Cache Settings
     CACHE_TTL = 3600  # 1 hour
 
+    # Search Settings
+    RESULTS_BATCH_SIZE = 10  # Results translated together before being shown
+    QUICK_QUERY_MAX_WORDS = 6  # Longer queries are always sent to the model
+    QUICK_QUERY_MIN_TAG_LENGTH = 3  # Shorter words are not used as locally extracted tags
+
     # Model Parameters
     MODEL_PARAMS = {
         "max_new_tokens": 200,
@@ -35,6 +41,10 @@ class Config:
         'en': 'English',
         'gu': 'ગુજરાતી (Gujarati)'
     }
+    TRANSLATION_MAX_CHARS = 4500  # Google Translate rejects requests over 5000 characters
+    TRANSLATION_SEPARATOR = "\n\n|||\n\n"
+    MAX_TRANSLATION_WORKERS = 16
+    TRANSLATION_CACHE_SIZE = 4096  # Successful translations kept in process memory
 
     # Highlighting Settings
     HIGHLIGHT_COLORS = {
@@ -1,9 +1,50 @@
-import base64
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
 from github import Github
 import streamlit as st
 from config import Config
 import requests
-from typing import List, Dict
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Optional
+from urllib.parse import quote
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """
+    Shared HTTP session so requests reuse pooled keep-alive connections across reruns
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=Config.MAX_FETCH_WORKERS,
+        pool_maxsize=Config.MAX_FETCH_WORKERS
+    ))
+    return session
+
+@st.cache_resource
+def get_github_client() -> Github:
+    """
+    Shared GitHub client, created once per process
+    """
+    return Github(st.secrets["GITHUB_TOKEN"])
+
+def get_file_content(session: requests.Session, download_url: str, token: Optional[str] = None) -> str:
+    """
+    Download the raw text of a single file
+    """
+    headers = {"Authorization": f"token {token}"} if token else None
+    response = session.get(download_url, headers=headers)
+    response.raise_for_status()
+    return response.text
+
+def list_news_files(repo) -> List[str]:
+    """
+    List the paths of all news files in the repository with one recursive tree request
+    """
+    tree = repo.get_git_tree(Config.GITHUB_BRANCH, recursive=True)
+    return [
+        entry.path for entry in tree.tree
+        if entry.type == "blob" and fnmatch(entry.path.rsplit("/", 1)[-1], Config.NEWS_FILE_PATTERN)
+    ]
 
 @st.cache_data(ttl=3600)
 def get_github_file_contents() -> List[Dict]:
@@ -11,47 +52,62 @@ def get_github_file_contents() -> List[Dict]:
     Fetch all news text files and their contents from GitHub repository
     """
     try:
-        # Initialize GitHub client with access token
-        g = Github(st.secrets["GITHUB_TOKEN"])
+        # Reuse the shared GitHub client
+        g = get_github_client()
 
         # Get repository
         repo = g.get_repo(f"{Config.GITHUB_REPO_OWNER}/{Config.GITHUB_REPO_NAME}")
 
         # Get all files matching the pattern
-        contents = repo.get_contents("")
-        news_files = []
-
-        while contents:
-            file_content = contents.pop(0)
-            if file_content.type == "dir":
-                contents.extend(repo.get_contents(file_content.path))
-            elif file_content.name.startswith("dd_news_page_") and file_content.name.endswith(".txt"):
-                # Get the raw content directly
-                raw_content = base64.b64decode(file_content.content).decode('utf-8')
-                news_files.append({
-                    "name": file_content.name,
-                    "content": raw_content
-                })
-
-        return news_files
+        paths = list_news_files(repo)
+        raw_base = (
+            f"https://raw.githubusercontent.com/{Config.GITHUB_REPO_OWNER}/"
+            f"{Config.GITHUB_REPO_NAME}/{Config.GITHUB_BRANCH}/"
+        )
+
+        # Resolve the session and token here, since worker threads must not call into Streamlit
+        session = get_http_session()
+        token = st.secrets["GITHUB_TOKEN"]
+
+        # Download the raw contents concurrently instead of one file at a time
+        with ThreadPoolExecutor(max_workers=Config.MAX_FETCH_WORKERS) as executor:
+            raw_contents = list(executor.map(
+                lambda path: get_file_content(session, raw_base + quote(path), token),
+                paths
+            ))
+
+        return [
+            {"name": path.rsplit("/", 1)[-1], "content": raw_content}
+            for path, raw_content in zip(paths, raw_contents)
+        ]
     except Exception as e:
         st.error(f"Error accessing GitHub repository: {str(e)}")
         return []
 
+@st.cache_data(ttl=3600)
+def _fetch_repo_stats() -> Dict:
+    """
+    Fetch repository statistics; errors propagate so they are never cached
+    """
+    g = get_github_client()
+    repo = g.get_repo(f"{Config.GITHUB_REPO_OWNER}/{Config.GITHUB_REPO_NAME}")
+
+    # Count news files from the tree listing instead of downloading them
+    total_files = len(list_news_files(repo))
+
+    return {
+        "stars": repo.stargazers_count,
+        "forks": repo.forks_count,
+        "last_updated": repo.updated_at.strftime("%Y-%m-%d %H:%M:%S"),
+        "total_files": total_files
+    }
+
 def get_repo_stats() -> Dict:
     """
     Get repository statistics
     """
     try:
-        g = Github(st.secrets["GITHUB_TOKEN"])
-        repo = g.get_repo(f"{Config.GITHUB_REPO_OWNER}/{Config.GITHUB_REPO_NAME}")
-
-        return {
-            "stars": repo.stargazers_count,
-            "forks": repo.forks_count,
-            "last_updated": repo.updated_at.strftime("%Y-%m-%d %H:%M:%S"),
-            "total_files": len(get_github_file_contents())
-        }
+        return _fetch_repo_stats()
     except Exception as e:
         st.error(f"Error fetching repository stats: {str(e)}")
         return {
@@ -1,10 +1,50 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from deep_translator import GoogleTranslator
 import streamlit as st
 import re
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 from config import Config
 
+# Everything outside the Gujarati block; stripping it leaves only Gujarati characters
+_NON_GUJARATI_RE = re.compile(r"[^\u0a80-\u0aff]+")
+
 @st.cache_data(ttl=3600)
+def _translate_remote(text: str, source_lang: str, target_lang: str) -> str:
+    """
+    Translate text with Google Translate, shared across sessions by Streamlit's cache
+    """
+    translator = GoogleTranslator(source=source_lang, target=target_lang)
+    return translator.translate(text)
+
+# In-process LRU of successful translations keyed by (text, source, target), in front of
+# the Streamlit cache, which re-hashes the text on every call. Sessions run in separate threads.
+_translation_cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+_translation_cache_lock = Lock()
+
+def _get_cached_translation(text: str, source_lang: str, target_lang: str) -> Optional[str]:
+    """
+    Look up a previous successful translation, marking it as recently used
+    """
+    key = (text, source_lang, target_lang)
+    with _translation_cache_lock:
+        translated = _translation_cache.get(key)
+        if translated is not None:
+            _translation_cache.move_to_end(key)
+        return translated
+
+def _store_translation(text: str, source_lang: str, target_lang: str, translated: str) -> None:
+    """
+    Remember a successful translation, evicting the least recently used one when full
+    """
+    with _translation_cache_lock:
+        _translation_cache[(text, source_lang, target_lang)] = translated
+        _translation_cache.move_to_end((text, source_lang, target_lang))
+        if len(_translation_cache) > Config.TRANSLATION_CACHE_SIZE:
+            _translation_cache.popitem(last=False)
+
 def translate_text(text: str, source_lang: str, target_lang: str) -> str:
     """
     Translate text between English and Gujarati
@@ -12,50 +52,183 @@ def translate_text(text: str, source_lang: str, target_lang: str) -> str:
     if not text or source_lang == target_lang:
         return text
 
+    translated = _get_cached_translation(text, source_lang, target_lang)
+    if translated is not None:
+        return translated
+
     try:
-        translator = GoogleTranslator(source=source_lang, target=target_lang)
-        return translator.translate(text)
+        translated = _translate_remote(text, source_lang, target_lang)
     except Exception as e:
+        # Failures raise through the caches, so they are retried on the next call
         st.error(f"Translation error: {str(e)}")
         return text
 
-def detect_language(text: str) -> str:
+    _store_translation(text, source_lang, target_lang, translated)
+    return translated
+
+def _batch_texts(texts: List[str]) -> List[List[str]]:
     """
-    Detect if text is English or Gujarati
+    Group texts into batches that fit in a single translation request once joined
     """
-    gujarati_chars = len([c for c in text if '\u0a80' <= c <= '\u0aff'])
-    return 'gu' if gujarati_chars > len(text) * 0.3 else 'en'
+    batches = []
+    current = []
+    current_size = 0
+    separator_size = len(Config.TRANSLATION_SEPARATOR)
 
-def highlight_matching_text(content: str, search_terms: List[str], case_sensitive: bool = False) -> str:
+    for text in texts:
+        size = len(text) + (separator_size if current else 0)
+        if current and current_size + size > Config.TRANSLATION_MAX_CHARS:
+            batches.append(current)
+            current = []
+            current_size = 0
+            size = len(text)
+        current.append(text)
+        current_size += size
+
+    if current:
+        batches.append(current)
+    return batches
+
+def _translate_batch(batch: List[str], source_lang: str, target_lang: str) -> Optional[List[str]]:
     """
-    Highlight matching terms in content using custom colors
+    Translate a batch of texts in one request, or return None if it could not be split back
+    """
+    try:
+        translator = GoogleTranslator(source=source_lang, target=target_lang)
+        if len(batch) == 1:
+            return [translator.translate(batch[0])]
+        joined = translator.translate(Config.TRANSLATION_SEPARATOR.join(batch))
+    except Exception:
+        return None
+
+    parts = [part.strip() for part in joined.split(Config.TRANSLATION_SEPARATOR.strip())]
+    return parts if len(parts) == len(batch) else None
+
+def translate_texts(texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+    """
+    Translate several texts with one request per batch, joined by a separator
+    """
+    if source_lang == target_lang:
+        return list(texts)
+
+    translated = list(texts)
+
+    # Only texts missing from the in-process cache are sent to the translator
+    positions = []
+    for idx, text in enumerate(texts):
+        if not text:
+            continue
+        cached = _get_cached_translation(text, source_lang, target_lang)
+        if cached is None:
+            positions.append(idx)
+        else:
+            translated[idx] = cached
+
+    batches = _batch_texts([texts[idx] for idx in positions])
+
+    # Batches are independent network round-trips, so send them concurrently
+    with ThreadPoolExecutor(max_workers=Config.MAX_TRANSLATION_WORKERS) as executor:
+        batch_results = list(executor.map(
+            lambda batch: _translate_batch(batch, source_lang, target_lang),
+            batches
+        ))
+
+    offset = 0
+    for batch, parts in zip(batches, batch_results):
+        if parts is None:
+            # Fall back to one request per text if the batch failed or the separator did not survive;
+            # translate_text caches its own successes
+            parts = [translate_text(text, source_lang, target_lang) for text in batch]
+        else:
+            for text, part in zip(batch, parts):
+                _store_translation(text, source_lang, target_lang, part)
+
+        for part in parts:
+            translated[positions[offset]] = part
+            offset += 1
+
+    return translated
+
+def detect_language(text: str, sample_size: int = 512) -> str:
+    """
+    Detect if text is English or Gujarati from a sample of its leading characters
+    """
+    return _detect_sample_language(text[:sample_size])
+
+@lru_cache(maxsize=4096)
+def _detect_sample_language(sample: str) -> str:
+    """
+    Classify a text sample by its share of Gujarati characters
+    """
+    gujarati_chars = len(_NON_GUJARATI_RE.sub('', sample))
+    return 'gu' if gujarati_chars > len(sample) * 0.3 else 'en'
+
+@lru_cache(maxsize=256)
+def _compile_terms(terms: Tuple[str, ...], flags: int = 0) -> Tuple[re.Pattern, Dict[str, str]]:
+    """
+    Compile search terms into a single alternation and map each group to its color
     """
-    highlighted_content = content
     colors = list(Config.HIGHLIGHT_COLORS.values())
+    color_map = {}
+    alternatives = []
 
-    for idx, term in enumerate(search_terms):
+    for idx, term in enumerate(terms):
         if not term.strip():
             continue
+        group = f"g{idx}"
+        color_map[group] = colors[idx % len(colors)]
+        alternatives.append((term, group))
 
-        color = colors[idx % len(colors)]
+    # Prefer longer terms so overlapping terms highlight the widest match
+    alternatives.sort(key=lambda item: len(item[0]), reverse=True)
+    pattern = "|".join(f"(?P<{group}>{re.escape(term)})" for term, group in alternatives)
 
-        if not case_sensitive:
-            pattern = re.compile(re.escape(term), re.IGNORECASE)
-        else:
-            pattern = re.compile(re.escape(term))
+    return re.compile(pattern, flags), color_map
 
-        highlighted_content = pattern.sub(
-            lambda m: f'<span style="background-color: {color}; padding: 0 2px; border-radius: 3px;">{m.group()}</span>',
-            highlighted_content
+def highlight_matching_text(content: str, search_terms: List[str], case_sensitive: bool = False) -> str:
+    """
+    Highlight matching terms in content using custom colors
+    """
+    if case_sensitive:
+        haystack = content
+        pattern, color_map = _compile_terms(tuple(search_terms))
+    else:
+        # Match case-folded terms against case-folded content instead of using IGNORECASE
+        haystack = content.casefold()
+        pattern, color_map = _compile_terms(tuple(term.casefold() for term in search_terms))
+        if len(haystack) != len(content):
+            # Folding changed the length (e.g. "ß" -> "ss"), so offsets would not line up
+            haystack = content
+            pattern, color_map = _compile_terms(tuple(search_terms), re.IGNORECASE)
+
+    if not color_map:
+        return content
+
+    # Splice highlights into the original content so its casing is preserved
+    parts = []
+    last_end = 0
+    for match in pattern.finditer(haystack):
+        start, end = match.span()
+        parts.append(content[last_end:start])
+        parts.append(
+            f'<span style="background-color: {color_map[match.lastgroup]}; padding: 0 2px; border-radius: 3px;">{content[start:end]}</span>'
         )
+        last_end = end
+    parts.append(content[last_end:])
 
-    return highlighted_content
+    return "".join(parts)
 
-@st.cache_data(ttl=3600)
 def get_color_legend(search_terms: List[str]) -> str:
     """
     Generate HTML for color legend
     """
+    return _build_color_legend(tuple(search_terms))
+
+@lru_cache(maxsize=256)
+def _build_color_legend(search_terms: Tuple[str, ...]) -> str:
+    """
+    Build the color legend HTML, cached in-process since the tags rarely change between reruns
+    """
     if not search_terms:
         return ""
 
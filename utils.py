@@ -1,14 +1,72 @@
 import logging
 import re
+from collections import defaultdict
 from datetime import datetime
-from typing import Tuple, List, Dict, Optional
-import streamlit as st
+from itertools import islice
+from typing import Iterable, Iterator, Tuple, List, Dict, Optional
 from config import Config
+from translate_utils import translate_text, translate_texts, detect_language, highlight_matching_text
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Patterns compiled once at import instead of on every call
+_TITLE_RE = re.compile(r"Title:\s*(.+?)(?=Date:|$)", re.DOTALL)
+_DATE_RE = re.compile(r"Date:\s*(.+?)(?=Link:|$)", re.DOTALL)
+_LINK_RE = re.compile(r"Link:\s*(.+?)(?=Content:|$)", re.DOTALL)
+_CONTENT_RE = re.compile(r"Content:\s*(.+?)$", re.DOTALL)
+_TAGS_RE = re.compile(r"Tags:\s*\[(.*?)\]", re.IGNORECASE)
+# Dates use ASCII digits only: \d would also accept Gujarati digits, which strptime rejects
+_RESPONSE_DATE_RE = re.compile(r"Date:\s*([0-9]{2}-[0-9]{2}-[0-9]{4})")
+_DATE_VALIDATE_RE = re.compile(r"([0-9]{2})-([0-9]{2})-([0-9]{4})")
+
+# Static stylesheet injected on every rerun, built once at import
+_CUSTOM_CSS = """
+    <style>
+    .stExpander {
+        border: 1px solid #ddd;
+        border-radius: 8px;
+        margin-bottom: 15px;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
+    }
+    .search-result {
+        padding: 15px;
+        margin: 12px 0;
+        border: 1px solid #eee;
+        border-radius: 8px;
+        background-color: #ffffff;
+    }
+    .color-legend {
+        display: flex;
+        flex-wrap: wrap;
+        gap: 12px;
+        margin: 15px 0;
+        padding: 10px;
+        background-color: #f8f9fa;
+        border-radius: 6px;
+    }
+    .legend-item {
+        padding: 4px 10px;
+        border-radius: 4px;
+        font-size: 0.9em;
+        box-shadow: 0 1px 2px rgba(0,0,0,0.05);
+    }
+    .translation-toggle {
+        margin-top: 12px;
+        padding: 8px;
+        background-color: #f8f9fa;
+        border-radius: 6px;
+        border: 1px solid #eee;
+    }
+    .highlight {
+        padding: 2px 4px;
+        border-radius: 3px;
+        font-weight: 500;
+    }
+    </style>
+    """
+
 def parse_article(content: str) -> Dict[str, str]:
     """
     Parse article details from content with improved error handling and date parsing
@@ -21,10 +79,10 @@ def parse_article(content: str) -> Dict[str, str]:
         section = sections[0].strip()
 
         # Extract components with robust pattern matching
-        title_match = re.search(r"Title:\s*(.+?)(?=Date:|$)", section, re.DOTALL)
-        date_match = re.search(r"Date:\s*(.+?)(?=Link:|$)", section, re.DOTALL)
-        link_match = re.search(r"Link:\s*(.+?)(?=Content:|$)", section, re.DOTALL)
-        content_match = re.search(r"Content:\s*(.+?)$", section, re.DOTALL)
+        title_match = _TITLE_RE.search(section)
+        date_match = _DATE_RE.search(section)
+        link_match = _LINK_RE.search(section)
+        content_match = _CONTENT_RE.search(section)
 
         # Format date consistently
         date_str = date_match.group(1).strip() if date_match else "No Date"
@@ -61,7 +119,7 @@ def parse_mixtral_response(response: str) -> Tuple[List[str], Optional[str]]:
 
     try:
         # Extract tags with better pattern matching
-        tags_match = re.search(r"Tags:\s*\[(.*?)\]", response, re.IGNORECASE)
+        tags_match = _TAGS_RE.search(response)
         if tags_match:
             # Clean and validate tags
             tags = [
@@ -71,7 +129,7 @@ def parse_mixtral_response(response: str) -> Tuple[List[str], Optional[str]]:
             ]
 
         # Extract date with flexible format matching
-        date_match = re.search(r"Date:\s*(\d{2}-\d{2}-\d{4})", response)
+        date_match = _RESPONSE_DATE_RE.search(response)
         if date_match:
             # Validate date format
             if validate_date(date_match.group(1)):
@@ -82,54 +140,103 @@ def parse_mixtral_response(response: str) -> Tuple[List[str], Optional[str]]:
         logger.error(f"Error parsing Mixtral response: {str(e)}")
         return [], None
 
-def validate_date(date_str: str) -> bool:
+def parse_date(date_str: str) -> Optional[datetime]:
     """
-    Validate date string format with enhanced error handling
+    Parse a DD-MM-YYYY date, returning None if it is malformed or not a real date
     """
     try:
-        datetime.strptime(date_str, "%d-%m-%Y")
-        return True
+        date_match = _DATE_VALIDATE_RE.fullmatch(date_str)
+        if not date_match:
+            return None
+        # Building the date checks day and month bounds without reparsing a format string
+        return datetime(int(date_match.group(3)), int(date_match.group(2)), int(date_match.group(1)))
     except (ValueError, TypeError):
-        return False
+        return None
+
+def validate_date(date_str: str) -> bool:
+    """
+    Validate date string format with enhanced error handling
+    """
+    return parse_date(date_str) is not None
 
-def format_search_results(results: List[Dict], tags: List[str], target_lang: str) -> List[Dict]:
+def format_search_results(results: Iterable[Dict], tags: List[str], target_lang: str) -> Iterator[Dict]:
+    """
+    Format search results in small batches, yielding each one as soon as its batch is translated
+    """
+    results = iter(results)
+    while batch := list(islice(results, Config.RESULTS_BATCH_SIZE)):
+        yield from format_result_batch(batch, tags, target_lang)
+
+def format_result_batch(results: List[Dict], tags: List[str], target_lang: str) -> List[Dict]:
     """
     Format search results with translations and highlighting with improved handling
     """
     formatted_results = []
+    content_langs = []
+
+    # Texts needing translation, grouped by source language as (result index, field, text)
+    pending = defaultdict(list)
 
     for result in results:
         try:
             formatted_result = result.copy()
+            idx = len(formatted_results)
 
-            # Detect language of title and content
-            title_lang = detect_language(result['title'])
+            # Use the languages detected at index time, detecting only when missing
+            title_lang = result.get('_title_lang') or detect_language(result['title'])
+            content_lang = result.get('_lang') or detect_language(result.get('content', ''))
 
-            # Translate title if needed
             if target_lang != title_lang:
-                formatted_result['title'] = translate_text(
-                    result['title'],
-                    title_lang,
-                    target_lang
-                )
-
-            # Format content with highlighting and translation
-            formatted_result = format_article_content(formatted_result, tags, target_lang)
+                pending[title_lang].append((idx, 'title', result['title']))
+            if target_lang != content_lang:
+                pending[content_lang].append((idx, 'content', result.get('content', '')))
+
             formatted_results.append(formatted_result)
+            content_langs.append(content_lang)
 
         except Exception as e:
             logger.error(f"Error formatting result: {str(e)}")
             formatted_results.append(result)  # Add original result if formatting fails
+            content_langs.append(None)
+
+    # Translate each language bucket in as few requests as possible
+    translations = {}
+    for source_lang, items in pending.items():
+        translated = translate_texts([text for _, _, text in items], source_lang, target_lang)
+        for (idx, field, _), text in zip(items, translated):
+            translations[idx, field] = text
+
+    for idx, formatted_result in enumerate(formatted_results):
+        if content_langs[idx] is None:
+            continue
+        if (idx, 'title') in translations:
+            formatted_result['title'] = translations[idx, 'title']
+
+        # Format content with highlighting and translation
+        formatted_results[idx] = format_article_content(
+            formatted_result,
+            tags,
+            target_lang,
+            source_lang=content_langs[idx],
+            translated_content=translations.get((idx, 'content'))
+        )
 
     return formatted_results
 
-def format_article_content(article: Dict, tags: List[str], target_lang: str) -> Dict:
+def format_article_content(
+    article: Dict,
+    tags: List[str],
+    target_lang: str,
+    source_lang: Optional[str] = None,
+    translated_content: Optional[str] = None
+) -> Dict:
     """
     Format and translate article content with improved handling
     """
     try:
         content = article.get('content', '')
-        source_lang = detect_language(content)
+        if source_lang is None:
+            source_lang = detect_language(content)
 
         # Store original content and language
         article['original_content'] = content
@@ -137,7 +244,8 @@ def format_article_content(article: Dict, tags: List[str], target_lang: str) ->
 
         # Translate if needed and target language is different
         if target_lang != source_lang:
-            translated_content = translate_text(content, source_lang, target_lang)
+            if translated_content is None:
+                translated_content = translate_text(content, source_lang, target_lang)
             # Highlight in translated content if there are tags
             if tags:
                 highlighted_translated = highlight_matching_text(translated_content, tags)
@@ -156,49 +264,6 @@ def format_article_content(article: Dict, tags: List[str], target_lang: str) ->
 
 def create_custom_css() -> str:
     """
-    Generate custom CSS for the application with improved styling
-    """
-    return """
-    <style>
-    .stExpander {
-        border: 1px solid #ddd;
-        border-radius: 8px;
-        margin-bottom: 15px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-    }
-    .search-result {
-        padding: 15px;
-        margin: 12px 0;
-        border: 1px solid #eee;
-        border-radius: 8px;
-        background-color: #ffffff;
-    }
-    .color-legend {
-        display: flex;
-        flex-wrap: wrap;
-        gap: 12px;
-        margin: 15px 0;
-        padding: 10px;
-        background-color: #f8f9fa;
-        border-radius: 6px;
-    }
-    .legend-item {
-        padding: 4px 10px;
-        border-radius: 4px;
-        font-size: 0.9em;
-        box-shadow: 0 1px 2px rgba(0,0,0,0.05);
-    }
-    .translation-toggle {
-        margin-top: 12px;
-        padding: 8px;
-        background-color: #f8f9fa;
-        border-radius: 6px;
-        border: 1px solid #eee;
-    }
-    .highlight {
-        padding: 2px 4px;
-        border-radius: 3px;
-        font-weight: 500;
-    }
-    </style>
+    Return the custom CSS for the application with improved styling
     """
+    return _CUSTOM_CSS